@@ -17,6 +17,19 @@ public class BuildStarter
     private const string TargetsMd = "targets.md";
     private const string MsbuildExe = "msbuild.exe";
 
+    // Targets files installed in $(ProgramFiles)\nbuild
+    private static readonly string[] TargetFiles =
+    [
+        "common.targets",
+        "git.targets",
+        "dotnet.targets",
+        "code.targets",
+        "node.targets",
+        "nuget.targets",
+        "ngit.targets",
+        "mongodb.targets",
+    ];
+
     /// <summary>
     /// Builds the specified target using nbuild.
     /// </summary>
@@ -55,7 +68,7 @@ public class BuildStarter
 
         //  Get location of msbuild.exe
         //var msbuildPath = ShellUtility.GetFullPathOfFile(MsbuildExe);
-        var msbuildPath = FindMsBuild64BitPath(verbose: true);
+        var msbuildPath = FindMsBuild64BitPath(verbose);
 
         if (verbose)
         {
@@ -107,31 +120,8 @@ public class BuildStarter
         if (ValidTarget(nbuildPath, target)) return true;
 
         // check if target is valid in the target files in $(ProgramFiles)\nbuild
-
-        List<string> TargetFiles =
-        [
-            "common.targets",
-                "git.targets",
-                "dotnet.targets",
-                "code.targets",
-                "node.targets",
-                "nuget.targets",
-                "ngit.targets",
-                "mongodb.targets",
-            ];
-
-        bool found = false;
-        foreach (var targetFile in TargetFiles)
-        {
-            var path = Path.Combine($"{Environment.GetEnvironmentVariable("ProgramFiles")}\\nbuild", targetFile);
-            if (ValidTarget(path, target))
-            {
-                found = true;
-                break;
-            }
-        }
-
-        return found;
+        // stop at the first targets file that defines the target
+        return TargetFiles.Any(targetFile => ValidTarget(Path.Combine($"{Environment.GetEnvironmentVariable("ProgramFiles")}\\nbuild", targetFile), target));
     }
     
     ///<summary>
@@ -157,22 +147,16 @@ public class BuildStarter
             throw new FileNotFoundException($"'{targetsFile}' file not found.", buildXmlFile);
         }
 
-        XmlDocument doc = new XmlDocument();
-        doc.Load(buildXmlFile);
-
-        XmlNodeList targets = doc.GetElementsByTagName("Target");
-
-        if (targets != null)
+        // Stream the document, targets are yielded as they are read
+        using XmlReader reader = XmlReader.Create(buildXmlFile);
+        while (reader.Read())
         {
-            foreach (XmlNode target in targets)
+            if (reader.NodeType == XmlNodeType.Element && reader.Name == "Target")
             {
-                if (target.Attributes != null && target.Attributes["Name"] != null)
+                var attributeName = reader.GetAttribute("Name");
+                if (!string.IsNullOrEmpty(attributeName))
                 {
-                    var attributeName = target?.Attributes?["Name"]?.Value;
-                    if (!string.IsNullOrEmpty(attributeName))
-                    {
-                        yield return attributeName;
-                    }
+                    yield return attributeName;
                 }
             }
         }
@@ -186,12 +170,12 @@ public class BuildStarter
     public static IEnumerable<string> GetTargetsAndComments(string targetFileName)
     {
         var filePath = Path.Combine(Environment.CurrentDirectory, targetFileName);
-        string[] lines = File.ReadAllLines(filePath);
 
         StringBuilder commentBuilder = new();
         bool isComment = false;
 
-        foreach (string line in lines)
+        // Stream the file, targets are yielded as they are read
+        foreach (string line in File.ReadLines(filePath))
         {
             string trimmedLine = line.Trim();
 
@@ -251,16 +235,7 @@ public class BuildStarter
         string logFilePath = Path.Combine(Environment.CurrentDirectory, LogFile);
         if (File.Exists(logFilePath))
         {
-            string[] lines = File.ReadAllLines(logFilePath);
-            int start = lines.Length - lastLines;
-            if (start < 0)
-            {
-                start = 0;
-            }
-            for (int i = start; i < lines.Length; i++)
-            {
-                Console.WriteLine(lines[i]);
-            }
+            LogHelper.DisplayLastLines(logFilePath, lastLines);
         }
     }
 
@@ -272,22 +247,16 @@ public class BuildStarter
     /// <returns>An enumerable collection of attribute values.</returns>
     public static IEnumerable<string> GetImportAttributes(string filePath, string attributeName)
     {
-        XmlDocument doc = new XmlDocument();
-        doc.Load(filePath);
-
-        XmlNodeList imports = doc.GetElementsByTagName("Import");
-
-        if (imports != null)
+        // Stream the document, yielding each Import attribute
+        using XmlReader reader = XmlReader.Create(filePath);
+        while (reader.Read())
         {
-            foreach (XmlNode import in imports)
+            if (reader.NodeType == XmlNodeType.Element && reader.Name == "Import")
             {
-                if (import.Attributes != null && import.Attributes[attributeName] != null)
+                var projectName = reader.GetAttribute(attributeName);
+                if (projectName != null)
                 {
-                    var projectName = import?.Attributes?[attributeName]?.Value;
-                    if (projectName != null)
-                    {
-                        yield return projectName;
-                    }
+                    yield return projectName;
                 }
             }
         }
@@ -316,24 +285,34 @@ public class BuildStarter
             }
         }
 
+        // Visual Studio installs the 64-bit msbuild.exe in Bin\amd64, check there before searching subdirectories
+        var knownPath = possibleDirectories
+            .Select(dir => Path.Combine(dir, "amd64", MsbuildExe))
+            .FirstOrDefault(File.Exists);
+        if (knownPath != null)
+        {
+            if (verbose) Console.WriteLine($"Found msbuild.exe at the standard path: {knownPath}");
+            return knownPath;
+        }
+
         // Search for msbuild.exe in the directories and their subdirectories
         var msbuildPaths = possibleDirectories
             .Where(Directory.Exists)
             .SelectMany(dir => Directory.EnumerateFiles(dir, "msbuild.exe", SearchOption.AllDirectories))
-            .Where(path => !path.Contains("Preview") && path.Contains("amd64"))
-            .ToList();
+            .Where(path => !path.Contains("Preview") && path.Contains("amd64"));
 
-        if (verbose)
+        // Only verbose output needs every path, otherwise stop searching at the first one found
+        if (!verbose) return msbuildPaths.FirstOrDefault();
+
+        var msbuildPathsFound = msbuildPaths.ToList();
+        Console.WriteLine("Found the following msbuild.exe paths:");
+        foreach (var path in msbuildPathsFound)
         {
-            Console.WriteLine("Found the following msbuild.exe paths:");
-            foreach (var path in msbuildPaths)
-            {
-                Console.WriteLine(path);
-            }
+            Console.WriteLine(path);
         }
 
         // Return the first path found, or null if no path was found
-        return msbuildPaths.FirstOrDefault();
+        return msbuildPathsFound.FirstOrDefault();
     }
 
     /// <summary>
@@ -342,11 +321,28 @@ public class BuildStarter
     /// <param name="filePath">The path to the target file.</param>
     /// <returns>A <see cref="ResultHelper"/> object representing the result of the operation.</returns>
     public static ResultHelper DisplayTargetsInFile(string filePath)
+    {
+        return DisplayTargetsInFile(filePath, new HashSet<string>(StringComparer.OrdinalIgnoreCase));
+    }
+
+    /// <summary>
+    /// Displays the targets in the specified file, skipping files already displayed.
+    /// </summary>
+    /// <param name="filePath">The path to the target file.</param>
+    /// <param name="displayedFiles">The full paths of the target files already displayed.</param>
+    /// <returns>A <see cref="ResultHelper"/> object representing the result of the operation.</returns>
+    private static ResultHelper DisplayTargetsInFile(string filePath, HashSet<string> displayedFiles)
         {
             //replace $(BuildTools) with environment variable ProgramFiles/Nbuild
             filePath = filePath.Replace("$(BuildTools)", $"{Environment.GetEnvironmentVariable("ProgramFiles")}\\nbuild");
             try
             {
+                // common targets files are imported by several files, display each one only once
+                if (!displayedFiles.Add(Path.GetFullPath(filePath)))
+                {
+                    return ResultHelper.Success();
+                }
+
                 using (StreamWriter writer = new(TargetsMd, true))
                 {
                     Console.WriteLine($"{filePath} Targets:");
@@ -379,14 +375,12 @@ public class BuildStarter
                     var importItem = item.Replace("$(ProgramFiles)", Environment.GetEnvironmentVariable("ProgramFiles"));
                     importItem = importItem.Replace("$(BuildTools)", $"{Environment.GetEnvironmentVariable("ProgramFiles")}\\nbuild");
 
-                    using (StreamWriter writer = new(TargetsMd, true))
-                    {
-                        Console.WriteLine($"Imported Targets:");
-                        //writer.WriteLine($"- Imported Targets: {importItem}\n");
-                        Console.WriteLine($"----------------------");
-                    }
+                    if (displayedFiles.Contains(Path.GetFullPath(importItem))) continue;
+
+                    Console.WriteLine($"Imported Targets:");
+                    Console.WriteLine($"----------------------");
                     // Recursive call for each imported target file
-                    DisplayTargetsInFile(importItem);
+                    DisplayTargetsInFile(importItem, displayedFiles);
                 }
 
             }
@@ -410,10 +404,11 @@ public class BuildStarter
             File.Delete(TargetsMd);
         }
 
-        string[] targetsFiles = Directory.GetFiles(directoryPath, "*.targets", SearchOption.TopDirectoryOnly);
+        var displayedFiles = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
+        var targetsFiles = Directory.EnumerateFiles(directoryPath, "*.targets", SearchOption.TopDirectoryOnly);
         foreach (var targetsFile in targetsFiles)
         {
-            var result = DisplayTargetsInFile(targetsFile);
+            var result = DisplayTargetsInFile(targetsFile, displayedFiles);
             if (!result.IsSuccess())
             {
                 return result;
@@ -17,6 +17,9 @@ namespace Nbuild
         private static bool Verbose = false;
         private static bool ValidJson = false;
 
+        // The downloads directory ACLs are updated once per process
+        private static bool DownloadsDirectoryAclsUpdated = false;
+
         public static bool TestMode
         {
             get { return _testMode; }
@@ -32,9 +35,6 @@ namespace Nbuild
         {
             // Examine this method when we implement the logic to require admin
             DownloadsDirectory = !TestMode || Ntools.CurrentProcess.IsElevated() ? "C:\\NToolsDownloads" : $"{Environment.GetEnvironmentVariable("Temp")}\\nb";
-
-            if (!Directory.Exists(DownloadsDirectory)) Directory.CreateDirectory(DownloadsDirectory);
-
         }
 
         private static bool IsTestMode()
@@ -52,19 +52,21 @@ namespace Nbuild
 
         private static bool CanRunCommand(bool modifyAcls = true)
         {
-            if (!Ntools.CurrentProcess.IsElevated())
+            var isElevated = Ntools.CurrentProcess.IsElevated();
+            if (!isElevated && !TestMode)
             {
-                if (!TestMode)
-                {
-                    return false;
-                }
+                return false;
             }
-            else
+
+            // Create the downloads directory on first use, it must exist before its ACLs are updated
+            if (!Directory.Exists(DownloadsDirectory)) Directory.CreateDirectory(DownloadsDirectory);
+
+            if (isElevated && !DownloadsDirectoryAclsUpdated)
             {
                 if (!UpdateDownloadsDirectoryAcls(modifyAcls)) return false;
-            }
 
-            if (!Directory.Exists(DownloadsDirectory)) Directory.CreateDirectory(DownloadsDirectory);
+                DownloadsDirectoryAclsUpdated = modifyAcls;
+            }
 
             // all good caller allowed to run this command
             return true;
@@ -115,10 +117,9 @@ namespace Nbuild
             ResultHelper result = ResultHelper.New();
             if (!CanRunCommand()) return ResultHelper.Fail(-1, $"You must run this command as an administrator");
 
-            var apps = GetApps(json);
-            if (apps == null) return ResultHelper.Fail(-1, $"Invalid json input");
+            var apps = GetApps(json).ToList();
 
-            if (Verbose) Colorizer.WriteLine($"[{ConsoleColor.Yellow}!{apps.Count()} apps to install.]");
+            if (Verbose) Colorizer.WriteLine($"[{ConsoleColor.Yellow}!{apps.Count} apps to install.]");
 
             foreach (var app in apps)
             {
@@ -138,10 +139,9 @@ namespace Nbuild
             ResultHelper result = ResultHelper.New();
             if (!CanRunCommand()) return ResultHelper.Fail(-1, $"You must run this command as an administrator");
 
-            var apps = GetApps(json);
-            if (apps == null) return ResultHelper.Fail(-1, $"Invalid json input");
+            var apps = GetApps(json).ToList();
 
-            if (Verbose) Colorizer.WriteLine($"[{ConsoleColor.Yellow}!{apps.Count()} apps to Uninstall.]");
+            if (Verbose) Colorizer.WriteLine($"[{ConsoleColor.Yellow}!{apps.Count} apps to Uninstall.]");
 
             foreach (var app in apps)
             {
@@ -160,11 +160,9 @@ namespace Nbuild
         {
             Verbose = verbose;
 
-            var apps = GetApps(json);
+            var apps = GetApps(json).ToList();
 
-            if (apps == null) return ResultHelper.Fail(-1, $"Invalid json input");
-
-            Colorizer.WriteLine($"[{ConsoleColor.Yellow}!{apps.Count()} apps to list:]");
+            Colorizer.WriteLine($"[{ConsoleColor.Yellow}!{apps.Count} apps to list:]");
 
             // print header
             Colorizer.WriteLine($"[{ConsoleColor.Yellow}!|--------------------|----------------|-------------------|]");
@@ -172,20 +170,21 @@ namespace Nbuild
             Colorizer.WriteLine($"[{ConsoleColor.Yellow}!|--------------------|----------------|-------------------|]");
             foreach (var app in apps)
             {
+                // installed version used for both the color and the row
+                var installedVersion = GetAppFileVersion(app);
+                if (Verbose && installedVersion != null) Colorizer.WriteLine($"[{ConsoleColor.Yellow}!{app.Name} {app.Version} current version: {installedVersion}]");
+
                 // display app and installed version
-                // InstalledAppFileVersionGreterOrEqual is true, print green, else print red
-                if (IsAppVersionEqual(app))
+                // installed version equal print green, greater print cyan, else print red
+                var color = ConsoleColor.Red;
+                if (Version.TryParse(installedVersion, out Version? installedVersionParsed) && Version.TryParse(app.Version, out Version? versionParsed))
                 {
-                    Colorizer.WriteLine($"[{ConsoleColor.Green}!| {app.Name,-18} | {app.Version,-14} | {GetAppFileVersion(app),-18}|]");
-                }
-                else if (IsAppVersionGreaterOrEqual(app))
-                {
-                    Colorizer.WriteLine($"[{ConsoleColor.Cyan}!| {app.Name,-18} | {app.Version,-14} | {GetAppFileVersion(app),-18}|]");
-                }
-                else
-                {
-                    Colorizer.WriteLine($"[{ConsoleColor.Red}!| {app.Name,-18} | {app.Version,-14} | {GetAppFileVersion(app),-18}|]");
+                    color = installedVersionParsed == versionParsed ? ConsoleColor.Green
+                        : installedVersionParsed > versionParsed ? ConsoleColor.Cyan
+                        : ConsoleColor.Red;
                 }
+
+                Colorizer.WriteLine($"[{color}!| {app.Name,-18} | {app.Version,-14} | {installedVersion,-18}|]");
             }
 
             Console.WriteLine();
@@ -198,11 +197,9 @@ namespace Nbuild
 
             if (!CanRunCommand()) return ResultHelper.Fail(-1, $"You must run this command as an administrator");
 
-            var apps = GetApps(json);
+            var apps = GetApps(json).ToList();
 
-            if (apps == null) return ResultHelper.Fail(-1, $"Invalid json input");
-
-            Colorizer.WriteLine($"[{ConsoleColor.Yellow}!{apps.ToList().Count} apps to download to {DownloadsDirectory}]");
+            Colorizer.WriteLine($"[{ConsoleColor.Yellow}!{apps.Count} apps to download to {DownloadsDirectory}]");
 
             // print header
             Colorizer.WriteLine($"[{ConsoleColor.Yellow}! |--------------------|--------------------------------|-----------------|]");
@@ -259,8 +256,9 @@ namespace Nbuild
             
             // *** Important **
             // Set trusted Host and extension.  This assumes that due diligence has been done to ensure the file is safe to download
-            Nfile.SetTrustedHosts([new Uri(nbuildApp.WebDownloadFile).Host]);
-            var extension = Path.GetExtension(new Uri(nbuildApp.WebDownloadFile).AbsolutePath);
+            var webDownloadUri = new Uri(nbuildApp.WebDownloadFile);
+            Nfile.SetTrustedHosts([webDownloadUri.Host]);
+            var extension = Path.GetExtension(webDownloadUri.AbsolutePath);
             Nfile.SetAllowedExtensions([extension]);
 
             var result = Task.Run(async () => await Nfile.DownloadAsync(nbuildApp.WebDownloadFile, fileName)).Result;
@@ -299,8 +297,6 @@ namespace Nbuild
                 return ResultHelper.Fail(-1, $"Invalid json input");
             }
 
-            if (!Directory.Exists(DownloadsDirectory)) Directory.CreateDirectory(DownloadsDirectory);
-
             if (IsAppVersionGreaterOrEqual(nbuildApp))
             {
                 Colorizer.WriteLine($"[{ConsoleColor.Yellow}!√ {nbuildApp.Name} {GetAppFileVersion(nbuildApp)} already installed.]");
@@ -438,11 +434,15 @@ namespace Nbuild
             process.StartInfo.FileName = FileMappins.GetFullPathOfFile(process.StartInfo.FileName);
 
             Colorizer.WriteLine($"[{ConsoleColor.Yellow}! Uninstalling {nbuildApp.Name} {nbuildApp.Version}]");
-            if (Verbose) Colorizer.WriteLine($"[{ConsoleColor.Yellow}! Working Directory: {process.StartInfo.WorkingDirectory}]");
-            if (Verbose) Colorizer.WriteLine($"[{ConsoleColor.Yellow}! FileName: {process.StartInfo.FileName}]");
-            if (Verbose) Colorizer.WriteLine($"[{ConsoleColor.Yellow}! Arguments: {process.StartInfo.Arguments}]");
+            if (Verbose)
+            {
+                Colorizer.WriteLine($"[{ConsoleColor.Yellow}! Working Directory: {process.StartInfo.WorkingDirectory}]");
+                Colorizer.WriteLine($"[{ConsoleColor.Yellow}! FileName: {process.StartInfo.FileName}]");
+                Colorizer.WriteLine($"[{ConsoleColor.Yellow}! Arguments: {process.StartInfo.Arguments}]");
+
+                Colorizer.WriteLine($"[{ConsoleColor.Yellow}! Calling process.LockStart(Verbose)]");
+            }
 
-            if (Verbose) Colorizer.WriteLine($"[{ConsoleColor.Yellow}! Calling process.LockStart(Verbose)]");
             var result = process.LockStart(Verbose);
             if (result.IsSuccess())
 
@@ -492,23 +492,6 @@ namespace Nbuild
             return currentVersionParsed >= versionParsed;
         }
 
-        private static bool IsAppVersionEqual(NbuildApp nbuildApp)
-        {
-            var currentVersion = GetAppFileVersion(nbuildApp);
-            if (currentVersion == null)
-            {
-                return false;
-            }
-
-            if (Verbose) Colorizer.WriteLine($"[{ConsoleColor.Yellow}!{nbuildApp.Name} {nbuildApp.Version} current version: {currentVersion}]");
-
-            if (!Version.TryParse(currentVersion, out Version? currentVersionParsed)) return false;
-
-            if (!Version.TryParse(nbuildApp.Version, out Version? versionParsed)) return false;
-
-            return currentVersionParsed == versionParsed;
-        }
-
         public static IEnumerable<NbuildApp> GetApps(string? json)
         {
             if (string.IsNullOrEmpty(json))
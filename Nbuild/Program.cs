@@ -2,8 +2,6 @@
 using NbuildTasks;
 using Ntools;
 using OutputColorizer;
-using System.Diagnostics;
-using System.Reflection;
 
 namespace Nbuild;
 
@@ -15,9 +13,17 @@ public class Program
     private const string CmdList = "list";
     private const string CmdDownload = "download";
     private const string CmdHelp = "--help";
-    private const string NgitAssemblyExe = "ngit.exe";
     private static readonly int linesToDisplay = 10;
 
+    // Commands that read the apps json file
+    private static readonly HashSet<string> JsonCommands = new(StringComparer.InvariantCultureIgnoreCase)
+    {
+        CmdInstall,
+        CmdUninstall,
+        CmdList,
+        CmdDownload,
+    };
+
     static int Main(string[] args)
     {
         Colorizer.WriteLine($"[{ConsoleColor.Yellow}!{Nversion.Get()}]\n");
@@ -60,11 +66,11 @@ public class Program
 
                     result = options.Command switch
                     {
-                        var d when d == CmdTargets => BuildStarter.DisplayTargets(Environment.CurrentDirectory),
-                        var d when d == CmdInstall => Command.Install(options.Json, options.Verbose),
-                        var d when d == CmdUninstall => Command.Uninstall(options.Json, options.Verbose),
-                        var d when d == CmdList => Command.List(options.Json, options.Verbose),
-                        var d when d == CmdDownload => Command.Download(options.Json, options.Verbose),
+                        CmdTargets => BuildStarter.DisplayTargets(Environment.CurrentDirectory),
+                        CmdInstall => Command.Install(options.Json, options.Verbose),
+                        CmdUninstall => Command.Uninstall(options.Json, options.Verbose),
+                        CmdList => Command.List(options.Json, options.Verbose),
+                        CmdDownload => Command.Download(options.Json, options.Verbose),
                         _ => ResultHelper.Fail(-1, $"Invalid Command: '{options.Command}'"),
                     };
                 }
@@ -157,11 +163,7 @@ public class Program
     /// <exception cref="FileNotFoundException">Thrown when no file exists at the path specified by the Json property.</exception>
     private static string? UpdateJsonOption(Cli options)
     {
-        if ((string.IsNullOrEmpty(options.Json) && !string.IsNullOrEmpty(options.Command)) &&
-                    (options.Command.Equals(CmdInstall, StringComparison.InvariantCultureIgnoreCase) ||
-                    options.Command.Equals(CmdUninstall, StringComparison.InvariantCultureIgnoreCase) ||
-                    options.Command.Equals(CmdList, StringComparison.InvariantCultureIgnoreCase) ||
-                    options.Command.Equals(CmdDownload, StringComparison.InvariantCultureIgnoreCase)))
+        if (string.IsNullOrEmpty(options.Json) && !string.IsNullOrEmpty(options.Command) && JsonCommands.Contains(options.Command))
         {
             options.Json = $"{Environment.GetEnvironmentVariable("ProgramFiles")}\\Nbuild\\ntools.json";
         }
@@ -188,26 +190,15 @@ public class Program
         GitWrapper gitWrapper = new(project:null,verbose:verbose);
         if (!gitWrapper.IsGitConfigured(silent:true) || !gitWrapper.IsGitRepository(Environment.CurrentDirectory)) return;
 
-        // Get the directory of the current process
-        var executableDirectory = Path.GetDirectoryName(Assembly.GetExecutingAssembly().Location);
-
-        var process = new Process
-        {
-            StartInfo =
-            {
-                WorkingDirectory = Environment.CurrentDirectory,
-                FileName = Path.Combine(executableDirectory!, NgitAssemblyExe),
-                Arguments = $"-c branch",
-                RedirectStandardOutput = false,
-                RedirectStandardError = false,
-                UseShellExecute = false,
-            },
-        };
-
-        var resultHelper = process.LockStart(verbose);
-        if (!resultHelper.IsSuccess())
+        // Display the same line as 'ngit -c branch'
+        var branch = gitWrapper.Branch;
+        if (string.IsNullOrEmpty(branch))
         {
-            if (verbose) Console.WriteLine($"==> Failed to display git info:{resultHelper.GetFirstOutput()}");
+            if (verbose) Console.WriteLine($"==> Failed to display git info: branch not found");
+            return;
         }
+
+        var project = Path.GetFileName(Environment.CurrentDirectory);
+        Colorizer.WriteLine(GitWrapper.FormatGitInfo(project, branch, gitWrapper.Tag));
     }
 }
\ No newline at end of file
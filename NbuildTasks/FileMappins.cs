@@ -7,7 +7,7 @@ namespace NbuildTasks
     public class FileMappins
     {
         // This list is used to get the directory location to be used in the FileName of process.StartInfo
-        private static readonly List<string> FileMappings = new List<string>()
+        private static readonly HashSet<string> FileMappings = new HashSet<string>(StringComparer.OrdinalIgnoreCase)
             {
                 "powershell.exe",
                 "msiexec.exe",
@@ -16,14 +16,20 @@ namespace NbuildTasks
                 "reg.exe"
             };
 
+        // Full paths already resolved, the PATH search is done once per file name
+        private static readonly Dictionary<string, string> FullPaths = new Dictionary<string, string>(StringComparer.OrdinalIgnoreCase);
+
         public static string GetFullPathOfFile(string fileName)
         {
-            foreach (var mapping in FileMappings)
+            if (FileMappings.Contains(fileName))
             {
-                if (fileName.Equals(mapping, StringComparison.OrdinalIgnoreCase))
+                if (!FullPaths.TryGetValue(fileName, out var fullPath))
                 {
-                    return $"{ShellUtility.GetFullPathOfFile(mapping)}";
+                    fullPath = $"{ShellUtility.GetFullPathOfFile(fileName)}";
+                    FullPaths[fileName] = fullPath;
                 }
+
+                return fullPath;
             }
 
             return fileName;
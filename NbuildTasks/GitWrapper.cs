@@ -28,6 +28,16 @@ namespace NbuildTasks
 
         public bool Verbose = false;
 
+        // Global git configuration does not change while a tool runs, check it once per process
+        private static bool _gitConfigured;
+
+        // Current branch cached per working directory, shared like Process, cleared by commands that change it
+        private static string _branch;
+        private static string _branchWorkingDirectory;
+
+        // Parent directory of the projects
+        private string DevDir => $"{DevDrive}\\{MainDir}";
+
         /// <summary>
         /// Initializes a new instance of the GitWrapper class.
         /// Once Successful, The MainDir and DevDrive are set by the base class NtoolsEnvironmentVariables
@@ -39,7 +49,7 @@ namespace NbuildTasks
         { 
             Verbose = verbose;
 
-            Process.StartInfo.WorkingDirectory = project == null ? Environment.CurrentDirectory : $@"{DevDrive}\{MainDir}\{project}";
+            Process.StartInfo.WorkingDirectory = project == null ? Environment.CurrentDirectory : $@"{DevDir}\{project}";
 
             // print Parameters
             if (verbose) Console.WriteLine($"GitWrapper.Process.StartInfo.WorkingDirectory: {Process.StartInfo.WorkingDirectory}");
@@ -47,15 +57,13 @@ namespace NbuildTasks
 
         public bool SetWorkingDir(string url)
         {
-            var projectName = url.Split('/').Last().Split('.').First();
+            var projectName = GetProjectName(url);
             if (string.IsNullOrEmpty(projectName))
             {
                 return false;
             }
 
-              // change to project directory
-            var DevDir = $"{DevDrive}\\{MainDir}";
-
+            // change to project directory
             var solutionDir = $@"{DevDir}\{projectName}";
 
             Process.StartInfo.WorkingDirectory = string.IsNullOrEmpty(projectName) ? Environment.CurrentDirectory : solutionDir;
@@ -65,7 +73,46 @@ namespace NbuildTasks
             return true;
         }
 
-        public string Branch => GetBranch();
+        /// <summary>
+        /// Extracts the project name from a git url, i.e. https://github.com/user/project.git returns project
+        /// </summary>
+        /// <param name="url">The git url.</param>
+        /// <returns>The project name, empty if the url has none.</returns>
+        private static string GetProjectName(string url)
+        {
+            // last url segment up to the first '.'
+            var name = url.Substring(url.LastIndexOf('/') + 1);
+            var dot = name.IndexOf('.');
+            return dot < 0 ? name : name.Substring(0, dot);
+        }
+
+        /// <summary>
+        /// Formats the project, branch and tag line displayed by ngit and nb, in Colorizer markup.
+        /// </summary>
+        /// <param name="project">The project name.</param>
+        /// <param name="branch">The current branch.</param>
+        /// <param name="tag">The current tag.</param>
+        /// <returns>The git info line to pass to Colorizer.WriteLine.</returns>
+        public static string FormatGitInfo(string project, string branch, string tag)
+        {
+            return $"[{ConsoleColor.DarkMagenta}!Project [{ConsoleColor.Yellow}!{project}] " +
+                    $"Branch [{ConsoleColor.Yellow}!{branch}] " +
+                    $"Tag [{ConsoleColor.Yellow}!{tag}]]";
+        }
+
+        public string Branch
+        {
+            get
+            {
+                if (string.IsNullOrEmpty(_branch) || _branchWorkingDirectory != Process.StartInfo.WorkingDirectory)
+                {
+                    _branch = GetBranch();
+                    _branchWorkingDirectory = Process.StartInfo.WorkingDirectory;
+                }
+
+                return _branch;
+            }
+        }
 
         public string Tag => GetTag();
 
@@ -171,8 +218,18 @@ namespace NbuildTasks
         private string GetBranch()
         {
             var branch = string.Empty;
-            Process.StartInfo.Arguments = $"branch";
+
+            // Ask git for the current branch
+            Process.StartInfo.Arguments = $"branch --show-current";
             var result = Process.LockStart(Verbose);
+            if ((result.Code == 0) && (result.Output.Count == 1) && !string.IsNullOrWhiteSpace(result.Output[0]))
+            {
+                return result.Output[0].Trim();
+            }
+
+            // detached HEAD or git older than 2.22, fall back to the branch list
+            Process.StartInfo.Arguments = $"branch";
+            result = Process.LockStart(Verbose);
             if ((result.Code == 0) && (result.Output.Count > 0))
             {
 
@@ -203,22 +260,27 @@ namespace NbuildTasks
 
         public bool LocalTagExists(string tag)
         {
-            return ListLocalTags().Any(x => x.Contains(tag));
+            // Let git filter the tags
+            Process.StartInfo.Arguments = $"tag --list \"*{tag}*\"";
+
+            var result = Process.LockStart(Verbose);
+            return result.Code == 0 && result.Output.Any(x => x.Contains(tag));
         }
 
         public bool RemoteTagExists(string tag)
         {
-            return ListRemoteTags().Any(x => x.Contains(tag));
+            // Ask the remote for the tag ref
+            Process.StartInfo.Arguments = $"ls-remote --tags origin refs/tags/{tag}";
+            var result = Process.LockStart(Verbose);
+            return result.Code == 0 && result.Output.Any(line => line.EndsWith($"refs/tags/{tag}"));
         }
 
         public bool DeleteTag(string tag)
         {
+            // delete the local tag only if it exists
             bool bResult = !ListLocalTags().Contains(tag) || DeleteLocalTag(tag);
 
-            // check if tag exists
-
-            var remoteTags = ListRemoteTags();
-            if (bResult && remoteTags.Any(x => x.Contains(tag)))
+            if (bResult && RemoteTagExists(tag))
                 bResult = DeleteRemoteTag(tag);
 
             return bResult;
@@ -232,39 +294,18 @@ namespace NbuildTasks
             return result.Code == 0 && result.Output.Count >= 1 ? result.Output.ToList() : new List<string>();
         }
 
-        private List<string> DeleteRemoteTags(string url)
-        {
-            var tags = new List<string>();
-            Process.StartInfo.Arguments = $"ls-remote --tags {url}";
-            var result = Process.LockStart(Verbose);
-            if (result.Code == 0 && result.Output.Count >= 1)
-            {
-                foreach (var line in result.Output)
-                {
-                    // extract tag from line
-                    var items = line.Split('/');
-                    var tag = items.Last();
-                    Console.WriteLine($"{line} -deleting {tag}");
-                    DeleteRemoteTag(tag);
-                    tags.Add(line);
-                }
-            }
-
-            return tags;
-        }
-
         public List<string> ListRemoteTags()
         {
-            var tags = new List<string>();
             Process.StartInfo.Arguments = $"ls-remote --tags";
             var result = Process.LockStart(Verbose);
+
+            var tags = new List<string>(result.Output.Count);
             if (result.Code == 0 && result.Output.Count >= 1)
             {
                 foreach (var line in result.Output)
                 {
-                    // extract tag from line
-                    var items = line.Split('/');
-                    var tag = items.Last();
+                    // extract tag from line, the text after the last '/'
+                    var tag = line.Substring(line.LastIndexOf('/') + 1);
                     if (IsValid4Tag(tag) || IsValidTag(tag))
                         tags.Add(tag);
                 }
@@ -275,8 +316,6 @@ namespace NbuildTasks
 
         private bool DeleteLocalTag(string tag)
         {
-            if (!LocalTagExists(tag)) return true;
-
             Process.StartInfo.Arguments = $"tag -d {tag}";
 
             var result = Process.LockStart(Verbose);
@@ -287,8 +326,6 @@ namespace NbuildTasks
 
         private bool DeleteRemoteTag(string tag)
         {
-            if (!RemoteTagExists(tag)) return true;
-
             Process.StartInfo.Arguments = $"push origin :refs/tags/{tag}";
             var result = Process.LockStart(Verbose);
             if (result.Code == 0 && result.Output.Count >= 1)
@@ -313,7 +350,7 @@ namespace NbuildTasks
             }
 
             // extract project name from url
-            var projectName = url.Split('/').Last().Split('.').First();
+            var projectName = GetProjectName(url);
             if (string.IsNullOrEmpty(projectName))
             {
                 return ResultHelper.Fail(ResultHelper.InvalidParameter, $"Invalid url: {url}");
@@ -326,8 +363,6 @@ namespace NbuildTasks
 
             ResultHelper result;
             // change to project directory
-            var DevDir = $"{DevDrive}\\{MainDir}";
-
             var solutionDir = $@"{DevDir}\{projectName}";
             var dirExists = Directory.Exists(solutionDir);
             if (!dirExists)
@@ -339,6 +374,7 @@ namespace NbuildTasks
 
                 Process.StartInfo.WorkingDirectory = DevDir;
                 Process.StartInfo.Arguments = $"clone {url} ";
+                _branch = null;
 
                 result = Process.LockStart(Verbose);
                 if ((result.Code == 0) && (result.Output.Count > 0))
@@ -375,6 +411,9 @@ namespace NbuildTasks
                 result = Process.LockStart(Verbose);
             }
 
+            // checkout changes the current branch
+            _branch = null;
+
             if (result.Code == 0 && result.Output.Count >= 1)
             {
                 if (CheckForErrorAndDisplayOutput(result.Output))
@@ -393,10 +432,10 @@ namespace NbuildTasks
 
         public List<string> ListBranches()
         {
-            var branches = new List<string>();
-
             Process.StartInfo.Arguments = $"branch --list";
             var result = Process.LockStart(Verbose);
+
+            var branches = new List<string>(result.Output.Count);
             if (result.Code == 0 && result.Output.Count >= 1)
             {
                 foreach (var line in result.Output)
@@ -415,8 +454,9 @@ namespace NbuildTasks
         {
             foreach (var line in lines)
             {
-                return line.ToLower().Contains("error") ||
-                    line.ToLower().Contains("fatal");
+                // case-insensitive search
+                return line.IndexOf("error", StringComparison.OrdinalIgnoreCase) >= 0 ||
+                    line.IndexOf("fatal", StringComparison.OrdinalIgnoreCase) >= 0;
             }
             return false;
         }
@@ -447,8 +487,11 @@ namespace NbuildTasks
         /// <returns>True if git is configured, otherwise False</returns>
         public bool IsGitConfigured(bool silent = false)
         {
+            if (_gitConfigured) return true;
+
             if (!string.IsNullOrEmpty(GetGitUserNameConfiguration()) && !string.IsNullOrEmpty(GetGitUserEmailConfiguration()))
             {
+                _gitConfigured = true;
                 return true;
             }
 
@@ -0,0 +1,79 @@
+﻿using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Text;
+
+namespace NbuildTasks
+{
+    /// <summary>
+    /// Helper class for reading log files.
+    /// </summary>
+    public static class LogHelper
+    {
+        // Bytes read from the end of the log file, doubled until enough lines are found
+        private const int TailWindowSize = 64 * 1024;
+
+        /// <summary>
+        /// Reads the last lines of a log file without loading the whole file.
+        /// </summary>
+        /// <param name="fileName">The path of the log file.</param>
+        /// <param name="lineCount">The number of last lines to read.</param>
+        /// <returns>The last lines of the log file, fewer if the file is shorter.</returns>
+        public static List<string> ReadLastLines(string fileName, int lineCount)
+        {
+            var lines = new List<string>();
+            if (lineCount <= 0) return lines;
+
+            using (var stream = new FileStream(fileName, FileMode.Open, FileAccess.Read, FileShare.ReadWrite))
+            {
+                // detect the encoding from the byte order mark at the start of the file
+                Encoding encoding;
+                using (var reader = new StreamReader(stream, Encoding.UTF8, true, 1024, true))
+                {
+                    reader.Peek();
+                    encoding = reader.CurrentEncoding;
+                }
+
+                var charSize = encoding.GetByteCount("\n");
+                long windowSize = TailWindowSize;
+                while (true)
+                {
+                    var start = Math.Max(0, stream.Length - windowSize);
+                    start -= start % charSize;
+
+                    lines.Clear();
+                    stream.Seek(start, SeekOrigin.Begin);
+                    using (var reader = new StreamReader(stream, encoding, false, 4096, true))
+                    {
+                        string line;
+                        while ((line = reader.ReadLine()) != null)
+                        {
+                            lines.Add(line);
+                        }
+                    }
+
+                    // the first line of a window is usually cut, keep it only at the start of the file
+                    if (start > 0 && lines.Count > 0) lines.RemoveAt(0);
+
+                    if (lines.Count >= lineCount || start == 0) break;
+
+                    windowSize *= 2;
+                }
+            }
+
+            return lines.Skip(Math.Max(0, lines.Count - lineCount)).ToList();
+        }
+
+        /// <summary>
+        /// Displays the last lines of a log file with a single console write.
+        /// </summary>
+        /// <param name="fileName">The path of the log file.</param>
+        /// <param name="lineCount">The number of last lines to display.</param>
+        public static void DisplayLastLines(string fileName, int lineCount)
+        {
+            var lines = ReadLastLines(fileName, lineCount);
+            if (lines.Count > 0) Console.WriteLine(string.Join(Environment.NewLine, lines));
+        }
+    }
+}
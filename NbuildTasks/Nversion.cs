@@ -14,19 +14,12 @@ namespace NbuildTasks
         /// <returns>The formatted string containing the file description, product name, company name, legal copyright, and file version.</returns>
         public static string Get(string assembly = "")
         {
+            // Read the version resource of the requested assembly
+            var location = assembly == ExecutingAssembly
+                                                ? Assembly.GetExecutingAssembly().Location
+                                                : Assembly.GetEntryAssembly().Location;
 
-            FileVersionInfo fileVersionInfo = FileVersionInfo
-                                                .GetVersionInfo(Assembly
-                                                .GetEntryAssembly()
-                                                .Location);
-            if (assembly == ExecutingAssembly)
-            {
-                fileVersionInfo = FileVersionInfo.
-                                                GetVersionInfo(Assembly.
-                                                GetExecutingAssembly().
-                                                Location);
-
-            }
+            FileVersionInfo fileVersionInfo = FileVersionInfo.GetVersionInfo(location);
 
             return $" *** {fileVersionInfo.FileDescription}, " +
                             $"{fileVersionInfo.ProductName}, " +
@@ -16,13 +16,10 @@ namespace NbuildTasks
         /// <param name="fileName">The name of the file to create.</param>
         public static void ExtractEmbeddedResource(string resourceLocation, string fileName)
         {
-            Stream stream = Assembly.GetExecutingAssembly().GetManifestResourceStream(resourceLocation) ?? throw new ArgumentException("No such resource", nameof(resourceLocation));
+            using (Stream stream = Assembly.GetExecutingAssembly().GetManifestResourceStream(resourceLocation) ?? throw new ArgumentException("No such resource", nameof(resourceLocation)))
             using (var fileStream = new FileStream(fileName, FileMode.Create))
             {
-                for (int i = 0; i < stream.Length; i++)
-                {
-                    fileStream.WriteByte((byte)stream.ReadByte());
-                }
+                stream.CopyTo(fileStream);
             }
         }
 
@@ -36,13 +33,10 @@ namespace NbuildTasks
         {
             bool resourceFound = true;
 
-            Stream stream = Assembly.GetCallingAssembly().GetManifestResourceStream(resourceLocation) ?? throw new ArgumentException("No such resource", nameof(resourceLocation));
+            using (Stream stream = Assembly.GetCallingAssembly().GetManifestResourceStream(resourceLocation) ?? throw new ArgumentException("No such resource", nameof(resourceLocation)))
             using (var fileStream = new FileStream(fileName, FileMode.Create))
             {
-                for (int i = 0; i < stream.Length; i++)
-                {
-                    fileStream.WriteByte((byte)stream.ReadByte());
-                }
+                stream.CopyTo(fileStream);
             }
 
             return resourceFound;
@@ -56,13 +50,10 @@ namespace NbuildTasks
         /// <param name="fileName">The name of the file to create.</param>
         public static void ExtractEmbeddedResourceFromAssembly(string assembly, string resourceLocation, string fileName)
         {
-            Stream stream = Assembly.LoadFrom(assembly).GetManifestResourceStream(resourceLocation) ?? throw new ArgumentException("No such resource", nameof(resourceLocation));
+            using (Stream stream = Assembly.LoadFrom(assembly).GetManifestResourceStream(resourceLocation) ?? throw new ArgumentException("No such resource", nameof(resourceLocation)))
             using (var fileStream = new FileStream(fileName, FileMode.Create))
             {
-                for (int i = 0; i < stream.Length; i++)
-                {
-                    fileStream.WriteByte((byte)stream.ReadByte());
-                }
+                stream.CopyTo(fileStream);
             }
         }
 
@@ -96,18 +87,8 @@ namespace NbuildTasks
         /// <returns>True if the resource exists, false otherwise.</returns>
         private static bool Exist(Assembly assembly, string resourceLocation)
         {
-            string[] resourceNames = assembly.GetManifestResourceNames();
-            bool isPathCorrect = false;
-            foreach (string resourceName in resourceNames)
-            {
-                if (resourceName.Equals(resourceLocation, StringComparison.Ordinal))
-                {
-                    isPathCorrect = true;
-                    break;
-                }
-            }
-
-            return isPathCorrect;
+            // ordinal search that stops at the first match
+            return Array.IndexOf(assembly.GetManifestResourceNames(), resourceLocation) >= 0;
         }
 
     }
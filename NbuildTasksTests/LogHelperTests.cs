@@ -0,0 +1,41 @@
+﻿using Microsoft.VisualStudio.TestTools.UnitTesting;
+using System.IO;
+using System.Linq;
+
+namespace NbuildTasks.Tests
+{
+    [TestClass()]
+    public class LogHelperTests
+    {
+        [TestMethod()]
+        public void ReadLastLinesShortFileTest()
+        {
+            // Arrange
+            var logFile = Path.GetTempFileName();
+            File.WriteAllLines(logFile, new[] { "line 1", "line 2", "line 3" });
+
+            // Act
+            var lines = LogHelper.ReadLastLines(logFile, 5);
+
+            // Assert
+            CollectionAssert.AreEqual(new[] { "line 1", "line 2", "line 3" }, lines);
+            File.Delete(logFile);
+        }
+
+        [TestMethod()]
+        public void ReadLastLinesLargeFileTest()
+        {
+            // Arrange, log file larger than the tail window
+            var logFile = Path.GetTempFileName();
+            var allLines = Enumerable.Range(1, 20000).Select(i => $"log line {i}").ToArray();
+            File.WriteAllLines(logFile, allLines);
+
+            // Act
+            var lines = LogHelper.ReadLastLines(logFile, 12);
+
+            // Assert
+            CollectionAssert.AreEqual(allLines.Skip(allLines.Length - 12).ToArray(), lines);
+            File.Delete(logFile);
+        }
+    }
+}
@@ -232,6 +232,40 @@ namespace Nbuild.Tests
             File.Delete(testFileName);
         }
 
+        [TestMethod]
+        public void DisplayTargetsSharedImportTest()
+        {
+            // Arrange, two targets files import a shared one which imports the first back
+            var directory = Path.Combine(Path.GetTempPath(), Path.GetRandomFileName());
+            Directory.CreateDirectory(directory);
+            var firstFile = Path.Combine(directory, "first.targets");
+            var secondFile = Path.Combine(directory, "second.targets");
+            var sharedFile = Path.Combine(directory, "shared.targets");
+            File.WriteAllText(firstFile, $"<Project><Import Project=\"{sharedFile}\" /><Target Name=\"First\" /></Project>");
+            File.WriteAllText(secondFile, $"<Project><Import Project=\"{sharedFile}\" /><Target Name=\"Second\" /></Project>");
+            File.WriteAllText(sharedFile, $"<Project><Import Project=\"{firstFile}\" /><Target Name=\"Shared\" /></Project>");
+
+            var originalOut = Console.Out;
+            using var output = new StringWriter();
+            Console.SetOut(output);
+
+            // Act
+            var result = BuildStarter.DisplayTargets(directory);
+            Console.SetOut(originalOut);
+
+            // Assert, each file is displayed once and skipped imports print no header
+            var lines = output.ToString().Split(Environment.NewLine);
+            Assert.IsTrue(result.IsSuccess());
+            Assert.AreEqual(1, lines.Count(line => line == $"{firstFile} Targets:"));
+            Assert.AreEqual(1, lines.Count(line => line == $"{secondFile} Targets:"));
+            Assert.AreEqual(1, lines.Count(line => line == $"{sharedFile} Targets:"));
+            Assert.AreEqual(1, lines.Count(line => line == "Imported Targets:"));
+
+            // Cleanup
+            Directory.Delete(directory, true);
+            File.Delete("targets.md");
+        }
+
         [TestMethod()]
         public void FindMsBuildPathTest()
         {
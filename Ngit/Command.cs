@@ -83,8 +83,7 @@ namespace Ngit
             }
             else
             {
-                Colorizer.WriteLine($"[{ConsoleColor.Red}!Error: valid build type is required]");
-                Parser.DisplayHelp<Cli>(HelpFormat.Full);
+                InvalidParameter("build type");
             }
 
             return nextTag;
@@ -103,9 +102,7 @@ namespace Ngit
             }
             else
             {
-                returnCode = RetCode.InvalidParameter;
-                Colorizer.WriteLine($"[{ConsoleColor.Red}!Error: valid tag is required]");
-                Parser.DisplayHelp<Cli>(HelpFormat.Full);
+                returnCode = InvalidParameter("tag");
             }
 
             return returnCode;
@@ -123,9 +120,7 @@ namespace Ngit
             }
             else
             {
-                ReturnCode = RetCode.InvalidParameter;
-                Colorizer.WriteLine($"[{ConsoleColor.Red}!Error: valid tag is required]");
-                Parser.DisplayHelp<Cli>(HelpFormat.Full);
+                ReturnCode = InvalidParameter("tag");
             }
 
             return ReturnCode;
@@ -146,9 +141,7 @@ namespace Ngit
         {
             if (string.IsNullOrEmpty(options.Url))
             {
-                Colorizer.WriteLine($"[{ConsoleColor.Red}!Error: valid url is required]");
-                Parser.DisplayHelp<Cli>(HelpFormat.Full);
-                return RetCode.InvalidParameter;
+                return InvalidParameter("url");
             }
 
             var result = GitWrapper.CloneProject(options.Url); ;
@@ -178,9 +171,7 @@ namespace Ngit
             }
             else
             {
-                Colorizer.WriteLine($"[{ConsoleColor.Red}!Error: valid tag is required]");
-                Parser.DisplayHelp<Cli>(HelpFormat.Full);
-                retCode = RetCode.InvalidParameter;
+                retCode = InvalidParameter("tag");
             }
 
             return retCode;
@@ -207,22 +198,30 @@ namespace Ngit
 
             else
             {
-                Colorizer.WriteLine($"[{ConsoleColor.Red}!Error: valid build type is required]");
-                Parser.DisplayHelp<Cli>(HelpFormat.Full);
-                retCode = RetCode.InvalidParameter;
+                retCode = InvalidParameter("build type");
             }
 
             return retCode;
         }
 
+        /// <summary>
+        /// Displays the missing parameter error followed by the help.
+        /// </summary>
+        /// <param name="parameter">The name of the missing parameter.</param>
+        /// <returns>RetCode.InvalidParameter</returns>
+        private static RetCode InvalidParameter(string parameter)
+        {
+            Colorizer.WriteLine($"[{ConsoleColor.Red}!Error: valid {parameter} is required]");
+            Parser.DisplayHelp<Cli>(HelpFormat.Full);
+            return RetCode.InvalidParameter;
+        }
+
         private static void DisplayResults(string branch, string tag)
         {
             var project = Path.GetFileName(Directory.GetCurrentDirectory());
             if (!string.IsNullOrEmpty(branch))
             {
-                Colorizer.WriteLine($"[{ConsoleColor.DarkMagenta}!Project [{ConsoleColor.Yellow}!{project}] " +
-                                                        $"Branch [{ConsoleColor.Yellow}!{branch}] " +
-                                                        $"Tag [{ConsoleColor.Yellow}!{tag}]]");
+                Colorizer.WriteLine(GitWrapper.FormatGitInfo(project, branch, tag));
             }
             else
             {
@@ -41,57 +41,63 @@ namespace Nbackup
 
                                 backup.BackupOptions = ReplaceEnvironmentVariables(backup.BackupOptions);
 
-                                string arguments = $" Source: {backup.Source}\n" +
-                                                    $" Destination: {backup.Destination}\n" +
-                                                    $" BackupOptions: {backup.BackupOptions}\n";
+                                // build the display text and robocopy options in buffers, the exclude lists can be long
+                                StringBuilder arguments = new();
+                                arguments.Append($" Source: {backup.Source}\n")
+                                         .Append($" Destination: {backup.Destination}\n")
+                                         .Append($" BackupOptions: {backup.BackupOptions}\n");
+
+                                StringBuilder backupOptions = new(backup.BackupOptions);
 
                                 if (backup.ExcludeFolders != null)
                                 {
-                                    arguments += $" ExcludeFolders:";
+                                    arguments.Append($" ExcludeFolders:");
                                     foreach (var item in backup.ExcludeFolders)
                                     {
                                         // if item contains spaces, then enclose it in double quotes
                                         if (item.Contains(" "))
                                         {
-                                            arguments += $" \"{item}\",";
-                                            backup.BackupOptions += $" /XD \"{item}\"";
+                                            arguments.Append($" \"{item}\",");
+                                            backupOptions.Append($" /XD \"{item}\"");
                                         }
                                         else
                                         {
-                                            arguments += $" {item},";
-                                            backup.BackupOptions += $" /XD {item}";
+                                            arguments.Append($" {item},");
+                                            backupOptions.Append($" /XD {item}");
                                         }
                                     }
-                                    arguments = arguments.TrimEnd(',') + "\n";
+                                    TrimEndCommas(arguments).Append('\n');
                                 }
 
                                 if (backup.ExcludeFiles != null)
                                 {
-                                    arguments += $" ExcludeFiles:";
+                                    arguments.Append($" ExcludeFiles:");
                                     foreach (var item in backup.ExcludeFiles)
                                     {
                                         // if item contains spaces, then enclose it in double quotes
                                         if (item.Contains(" "))
                                         {
-                                            arguments += $" \"{item}\",";
-                                            backup.BackupOptions += $" /XF \"{item}\"";
+                                            arguments.Append($" \"{item}\",");
+                                            backupOptions.Append($" /XF \"{item}\"");
                                         }
                                         else
                                         {
-                                            arguments += $" {item},";
-                                            backup.BackupOptions += $" /XF {item}";
+                                            arguments.Append($" {item},");
+                                            backupOptions.Append($" /XF {item}");
                                         }
                                     }
-                                    arguments = arguments.TrimEnd(',') + "\n";
+                                    TrimEndCommas(arguments).Append('\n');
                                 }
 
                                 if (!string.IsNullOrEmpty(backup.LogFile))
                                 {
                                     backup.LogFile = ReplaceEnvironmentVariables(backup.LogFile);
-                                    arguments += $" LogFile:{backup.LogFile}\n";
-                                    backup.BackupOptions += $" /log+:{backup.LogFile}";
+                                    arguments.Append($" LogFile:{backup.LogFile}\n");
+                                    backupOptions.Append($" /log+:{backup.LogFile}");
                                 }
 
+                                backup.BackupOptions = backupOptions.ToString();
+
                                 Console.WriteLine(arguments);
 
                                 if (options.PerformBackup)
@@ -180,6 +186,20 @@ namespace Nbackup
             return destination.ToString();
         }
 
+        /// <summary>
+        /// Removes the trailing commas left after the last item of a list.
+        /// </summary>
+        /// <param name="text">The text to trim.</param>
+        /// <returns>The same StringBuilder for chaining.</returns>
+        private static StringBuilder TrimEndCommas(StringBuilder text)
+        {
+            while (text.Length > 0 && text[text.Length - 1] == ',')
+            {
+                text.Length--;
+            }
+            return text;
+        }
+
         private static void DisplayOutput(ResultHelper result, Backup backup)
         {
             if (!string.IsNullOrEmpty(backup.LogFile))
@@ -188,16 +208,7 @@ namespace Nbackup
                 {
                     Console.WriteLine("----------------------------------------------------------------------------");
 
-                    string[] lines = File.ReadAllLines(backup.LogFile);
-                    int start = lines.Length - 12;
-                    if (start < 0)
-                    {
-                        start = 0;
-                    }
-                    for (int i = start; i < lines.Length; i++)
-                    {
-                        Console.WriteLine(lines[i]);
-                    }
+                    LogHelper.DisplayLastLines(backup.LogFile, 12);
                 }
                 else
                 {